@@ -4,13 +4,148 @@
 # Sistema de Análise de Vendas
 # ============================================
 
+import copy
+import heapq
 import os
-from collections import defaultdict
+import sys
+from datetime import datetime
+from operator import itemgetter
 
+import numpy as np
 
-vendas = []
+# ============================================
+# ARMAZENAMENTO EM COLUNAS
+# ============================================
+
+# Maior quantidade que cabe na coluna int32 de VendasStore
+QUANTIDADE_MAXIMA = int(np.iinfo(np.int32).max)
+
+class VendasStore:
+    """
+    Armazena as vendas em colunas paralelas (Struct-of-Arrays).
+
+    Cada campo ocupa um numpy.ndarray contíguo, de modo que as agregações
+    viram reduções vetorizadas em vez de laços sobre dicionários. A
+    capacidade dobra quando o buffer enche, evitando realocar a cada venda.
+    O valor total não é armazenado: é sempre quantidade * valor_unitario.
+
+    Produtos e vendedores são guardados como códigos inteiros (codificação
+    por dicionário); os nomes ficam em nomes_produtos e nomes_vendedores.
+    """
+
+    COLUNAS = ('id', 'produto_codigo', 'vendedor_codigo', 'quantidade',
+               'valor_unitario', 'data', 'mes')
+
+    def __init__(self, capacidade=64):
+        self.n = 0
+        self.nomes_produtos = []
+        self.nomes_vendedores = []
+        self._codigos_produtos = {}
+        self._codigos_vendedores = {}
+
+        self.id = np.empty(capacidade, dtype=np.int64)
+        self.produto_codigo = np.empty(capacidade, dtype=np.int32)
+        self.vendedor_codigo = np.empty(capacidade, dtype=np.int32)
+        self.quantidade = np.empty(capacidade, dtype=np.int32)
+        self.valor_unitario = np.empty(capacidade, dtype=np.float64)
+        self.data = np.empty(capacidade, dtype=object)
+        self.mes = np.empty(capacidade, dtype=np.int32)
+
+    def __len__(self):
+        return self.n
+
+    def _crescer(self):
+        """
+        Dobra a capacidade de todas as colunas, copiando as linhas ocupadas.
+        """
+        capacidade = 2 * len(self.id)
+        for nome in self.COLUNAS:
+            antiga = getattr(self, nome)
+            nova = np.empty(capacidade, dtype=antiga.dtype)
+            nova[:self.n] = antiga[:self.n]
+            setattr(self, nome, nova)
+
+    @staticmethod
+    def _codificar(codigos, nomes, nome):
+        """
+        Retorna o código de um nome, atribuindo o próximo livre se for novo.
+        """
+        codigo = codigos.get(nome)
+        if codigo is None:
+            codigo = codigos[nome] = len(nomes)
+            nomes.append(nome)
+        return codigo
+
+    def adicionar(self, venda, mes):
+        """
+        Acrescenta uma venda ao final das colunas.
+
+        Args:
+            venda (dict): Venda já validada
+            mes (int): Código do mês da venda (ano * 12 + mês - 1)
+
+        Returns:
+            int: Posição da venda nas colunas
+        """
+        if self.n == len(self.id):
+            self._crescer()
+
+        # Colunas numéricas primeiro: se alguma escrita falhar, nenhum
+        # código de produto/vendedor terá sido distribuído
+        i = self.n
+        self.id[i] = venda['id']
+        self.quantidade[i] = venda['quantidade']
+        self.valor_unitario[i] = venda['valor_unitario']
+        self.data[i] = venda['data']
+        self.mes[i] = mes
+        self.produto_codigo[i] = self._codificar(
+            self._codigos_produtos, self.nomes_produtos, venda['produto']
+        )
+        self.vendedor_codigo[i] = self._codificar(
+            self._codigos_vendedores, self.nomes_vendedores, venda['vendedor']
+        )
+        self.n += 1
+        return i
+
+    def linha(self, i):
+        """
+        Reconstrói a venda da posição i como dicionário.
+
+        Args:
+            i (int): Posição da venda nas colunas
+
+        Returns:
+            dict: Venda no mesmo formato retornado por registrar_venda
+        """
+        return {
+            'id': int(self.id[i]),
+            'produto': self.nomes_produtos[self.produto_codigo[i]],
+            'vendedor': self.nomes_vendedores[self.vendedor_codigo[i]],
+            'quantidade': int(self.quantidade[i]),
+            'valor_unitario': float(self.valor_unitario[i]),
+            'valor_total': float(self.quantidade[i] * self.valor_unitario[i]),
+            'data': self.data[i]
+        }
+
+
+vendas = VendasStore()
 contador_id = 1
 
+# Agregados mantidos incrementalmente por registrar_venda
+_total_vendas_cache = 0.0
+_stats_vendedor = {}
+_stats_produto = {}
+_stats_mes = {}
+_cache_rankings = {}
+_cache_relatorio = None
+
+PASTA_RELATORIOS = 'relatorios'
+_pasta_relatorios_pronta = False
+
+# Índice de busca por vendedor, por código: posições das vendas e nome em casefold
+_linhas_por_vendedor = []
+_vendedores_casefold = []
+
 # ============================================
 # FUNÇÕES DE CADASTRO
 # ============================================
@@ -38,12 +173,25 @@ def registrar_venda(produto, vendedor, quantidade, valor_unitario, data):
     if not isinstance(quantidade, int) or quantidade <= 0:
         print("Erro: Quantidade deve ser um número inteiro positivo.")
         return None
+    if quantidade > QUANTIDADE_MAXIMA:
+        print(f"Erro: Quantidade não pode ser maior que {QUANTIDADE_MAXIMA}.")
+        return None
     if not isinstance(valor_unitario, (int, float)) or valor_unitario <= 0:
         print("Erro: Valor unitário deve ser um número positivo.")
         return None
+    try:
+        np.float64(valor_unitario)
+    except OverflowError:
+        print("Erro: Valor unitário excede o limite suportado.")
+        return None
     if len(data) != 10 or data[4] != '-' or data[7] != '-':
         print("Erro: Data deve estar no formato YYYY-MM-DD.")
         return None
+    try:
+        data_obj = datetime.strptime(data, '%Y-%m-%d')
+    except ValueError:
+        print("Erro: Data inválida ou fora do formato YYYY-MM-DD.")
+        return None
 
 
     valor_total = quantidade * valor_unitario
@@ -51,8 +199,8 @@ def registrar_venda(produto, vendedor, quantidade, valor_unitario, data):
 
     venda = {
         'id': contador_id,
-        'produto': produto.strip(),
-        'vendedor': vendedor.strip(),
+        'produto': sys.intern(produto.strip()),
+        'vendedor': sys.intern(vendedor.strip()),
         'quantidade': quantidade,
         'valor_unitario': valor_unitario,
         'valor_total': valor_total,
@@ -60,12 +208,55 @@ def registrar_venda(produto, vendedor, quantidade, valor_unitario, data):
     }
 
 
-    vendas.append(venda)
+    mes = data_obj.year * 12 + data_obj.month - 1
+    posicao = vendas.adicionar(venda, mes)
+    _indexar_vendedor(int(vendas.vendedor_codigo[posicao]), posicao)
     contador_id += 1
+    _atualizar_agregados(venda, mes)
 
     print(f"Venda ID {venda['id']} registrada com sucesso!")
     return venda
 
+def _atualizar_agregados(venda, mes):
+    """
+    Soma a contribuição de uma venda aos agregados em cache.
+
+    Args:
+        venda (dict): Venda recém-registrada
+        mes (int): Código do mês da venda (ano * 12 + mês - 1)
+    """
+    global _total_vendas_cache
+
+    valor_total = venda['valor_total']
+    _total_vendas_cache += valor_total
+
+    s = _stats_vendedor.get(venda['vendedor'])
+    if s is None:
+        s = _stats_vendedor[venda['vendedor']] = {'total_vendas': 0.0, 'quantidade_vendas': 0}
+    s['total_vendas'] += valor_total
+    s['quantidade_vendas'] += 1
+
+    s = _stats_produto.get(venda['produto'])
+    if s is None:
+        s = _stats_produto[venda['produto']] = {'total_vendido': 0.0, 'quantidade_vendida': 0}
+    s['total_vendido'] += valor_total
+    s['quantidade_vendida'] += venda['quantidade']
+
+    _stats_mes[mes] = _stats_mes.get(mes, 0.0) + valor_total
+
+def _indexar_vendedor(codigo, posicao):
+    """
+    Registra a posição de uma venda no índice de vendedores.
+
+    Args:
+        codigo (int): Código do vendedor em `vendas`
+        posicao (int): Posição da venda em `vendas`
+    """
+    if codigo == len(_linhas_por_vendedor):
+        _linhas_por_vendedor.append([])
+        _vendedores_casefold.append(vendas.nomes_vendedores[codigo].casefold())
+    _linhas_por_vendedor[codigo].append(posicao)
+
 # ============================================
 # FUNÇÕES DE CÁLCULOS
 # ============================================
@@ -77,10 +268,7 @@ def calcular_total_vendas():
     Returns:
         float: Total de todas as vendas
     """
-    if not vendas:
-        return 0.0
-
-    return sum([v['valor_total'] for v in vendas])
+    return _total_vendas_cache
 
 def calcular_vendas_por_vendedor():
     """
@@ -89,21 +277,14 @@ def calcular_vendas_por_vendedor():
     Returns:
         dict: {vendedor: {total_vendas, quantidade_vendas, valor_medio}}
     """
-
-    stats = defaultdict(lambda: {'total_vendas': 0.0, 'quantidade_vendas': 0})
-
-    for venda in vendas:
-        vendedor = venda['vendedor']
-        stats[vendedor]['total_vendas'] += venda['valor_total']
-        stats[vendedor]['quantidade_vendas'] += 1
-
-
-    for vendedor in stats:
-        total = stats[vendedor]['total_vendas']
-        qtd = stats[vendedor]['quantidade_vendas']
-        stats[vendedor]['valor_medio'] = total / qtd if qtd > 0 else 0.0
-
-    return dict(stats)
+    return {
+        vendedor: {
+            'total_vendas': s['total_vendas'],
+            'quantidade_vendas': s['quantidade_vendas'],
+            'valor_medio': s['total_vendas'] / s['quantidade_vendas']
+        }
+        for vendedor, s in _stats_vendedor.items()
+    }
 
 def calcular_vendas_por_produto():
     """
@@ -112,18 +293,14 @@ def calcular_vendas_por_produto():
     Returns:
         dict: {produto: {total_vendido, quantidade_vendida, receita}}
     """
-    stats = defaultdict(lambda: {'total_vendido': 0.0, 'quantidade_vendida': 0})
-
-    for venda in vendas:
-        produto = venda['produto']
-        stats[produto]['total_vendido'] += venda['valor_total']
-        stats[produto]['quantidade_vendida'] += venda['quantidade']
-
-
-    for produto in stats:
-        stats[produto]['receita'] = stats[produto]['total_vendido']
-
-    return dict(stats)
+    return {
+        produto: {
+            'total_vendido': s['total_vendido'],
+            'quantidade_vendida': s['quantidade_vendida'],
+            'receita': s['total_vendido']
+        }
+        for produto, s in _stats_produto.items()
+    }
 
 def calcular_vendas_por_mes():
     """
@@ -132,13 +309,7 @@ def calcular_vendas_por_mes():
     Returns:
         dict: {mes (YYYY-MM): total_vendas}
     """
-    stats = defaultdict(float)
-    for venda in vendas:
-        mes = extrair_mes(venda['data'])
-        stats[mes] += venda['valor_total']
-
-
-    return dict(sorted(stats.items()))
+    return {formatar_mes(mes): total for mes, total in sorted(_stats_mes.items())}
 
 # ============================================
 # FUNÇÕES DE RANKINGS
@@ -154,15 +325,16 @@ def ranking_vendedores(limite=5):
     Returns:
         list: Lista de tuplas (vendedor, total_vendas)
     """
-    stats_vendedor = calcular_vendas_por_vendedor()
-
-    stats_lista = stats_vendedor.items()
-
+    em_cache = _cache_rankings.get(('vendedores', limite))
+    if em_cache and em_cache[0] == contador_id:
+        return list(em_cache[1])
 
-    ranking = sorted(stats_lista, key=lambda item: item[1]['total_vendas'], reverse=True)
+    totais = ((vendedor, s['total_vendas']) for vendedor, s in _stats_vendedor.items())
 
 
-    return [(vendedor, dados['total_vendas']) for vendedor, dados in ranking[:limite]]
+    resultado = heapq.nlargest(limite, totais, key=itemgetter(1))
+    _cache_rankings[('vendedores', limite)] = (contador_id, resultado)
+    return list(resultado)
 
 def ranking_produtos(limite=5):
     """
@@ -174,14 +346,16 @@ def ranking_produtos(limite=5):
     Returns:
         list: Lista de tuplas (produto, quantidade_vendida)
     """
-    stats_produto = calcular_vendas_por_produto()
-    stats_lista = stats_produto.items()
+    em_cache = _cache_rankings.get(('produtos', limite))
+    if em_cache and em_cache[0] == contador_id:
+        return list(em_cache[1])
 
+    quantidades = ((produto, s['quantidade_vendida']) for produto, s in _stats_produto.items())
 
-    ranking = sorted(stats_lista, key=lambda item: item[1]['quantidade_vendida'], reverse=True)
 
-
-    return [(produto, dados['quantidade_vendida']) for produto, dados in ranking[:limite]]
+    resultado = heapq.nlargest(limite, quantidades, key=itemgetter(1))
+    _cache_rankings[('produtos', limite)] = (contador_id, resultado)
+    return list(resultado)
 
 def melhor_mes():
     """
@@ -195,7 +369,7 @@ def melhor_mes():
         return (None, 0.0)
 
 
-    return max(vendas_mes.items(), key=lambda item: item[1])
+    return max(vendas_mes.items(), key=itemgetter(1))
 
 # ============================================
 # FUNÇÕES DE RELATÓRIOS
@@ -206,11 +380,22 @@ def gerar_relatorio_geral():
     Coleta todas as estatísticas para o relatório.
 
     Returns:
-        dict: Dicionário com todas as informações
+        dict: Dicionário com todas as informações (cópia, livre para alterar)
+    """
+    return copy.deepcopy(_relatorio_geral())
+
+def _relatorio_geral():
     """
+    Relatório geral em cache até a próxima venda; não deve ser alterado.
+    """
+    global _cache_relatorio
+
     if not vendas:
         return None # Retorna None se não houver vendas
 
+    if _cache_relatorio and _cache_relatorio[0] == contador_id:
+        return _cache_relatorio[1]
+
     relatorio = {
         'total_vendas': calcular_total_vendas(),
         'estatisticas_vendedor': calcular_vendas_por_vendedor(),
@@ -221,6 +406,7 @@ def gerar_relatorio_geral():
         'melhor_mes': melhor_mes(),
         'total_transacoes': len(vendas)
     }
+    _cache_relatorio = (contador_id, relatorio)
     return relatorio
 
 def gerar_relatorio_vendedor(nome_vendedor):
@@ -234,123 +420,118 @@ def gerar_relatorio_vendedor(nome_vendedor):
         dict: Estatísticas do vendedor ou None se não encontrado.
     """
 
-    vendas_do_vendedor = [
-        v for v in vendas if nome_vendedor.lower() in v['vendedor'].lower()
+    consulta = nome_vendedor.casefold()
+    encontrados = [
+        linhas for linhas, nome_cf in zip(_linhas_por_vendedor, _vendedores_casefold)
+        if consulta in nome_cf
     ]
 
-    if not vendas_do_vendedor:
+    if not encontrados:
         return None
 
-    total_vendas = sum(v['valor_total'] for v in vendas_do_vendedor)
-    quantidade_vendas = len(vendas_do_vendedor)
+    indices = encontrados[0] if len(encontrados) == 1 else list(heapq.merge(*encontrados))
+
+    total_vendas = float((vendas.quantidade[indices] * vendas.valor_unitario[indices]).sum())
+    quantidade_vendas = len(indices)
     valor_medio = total_vendas / quantidade_vendas if quantidade_vendas > 0 else 0.0
 
 
-    produtos_vendidos = defaultdict(int)
-    for v in vendas_do_vendedor:
-        produtos_vendidos[v['produto']] += v['quantidade']
+    # Os produtos seguem a ordem em que aparecem nas vendas do vendedor
+    codigos = vendas.produto_codigo[indices]
+    quantidades = np.bincount(
+        codigos, weights=vendas.quantidade[indices], minlength=len(vendas.nomes_produtos)
+    )
+    _, primeiros = np.unique(codigos, return_index=True)
+    ordem = codigos[np.sort(primeiros)]
+    produtos_vendidos = {
+        vendas.nomes_produtos[codigo]: int(qtd)
+        for codigo, qtd in zip(ordem.tolist(), quantidades[ordem].tolist())
+    }
 
 
-    nome_oficial = vendas_do_vendedor[0]['vendedor'] if vendas_do_vendedor else nome_vendedor
+    nome_oficial = vendas.nomes_vendedores[vendas.vendedor_codigo[indices[0]]]
 
     return {
         'nome': nome_oficial,
         'total_vendas': total_vendas,
         'quantidade_transacoes': quantidade_vendas,
         'valor_medio_transacao': valor_medio,
-        'produtos_vendidos': dict(produtos_vendidos),
-        'lista_vendas': vendas_do_vendedor
+        'produtos_vendidos': produtos_vendidos,
+        'lista_vendas': [vendas.linha(i) for i in indices]
     }
 
-def exibir_relatorio_vendas():
+def _renderizar_texto(relatorio, emitir):
     """
-    Exibe relatório geral formatado no console.
-    """
-    relatorio = gerar_relatorio_geral()
-
-    if not relatorio:
-        print("\n*** Nenhuma venda registrada para gerar relatório. ***")
-        return
+    Monta o relatório geral em texto, linha a linha.
 
-    print("\n" + "=" * 40)
-    print("      RELATÓRIO GERAL DE VENDAS")
-    print("=" * 40)
+    Args:
+        relatorio (dict): Relatório gerado por gerar_relatorio_geral
+        emitir (callable): Recebe cada trecho de texto (ex.: list.append)
+    """
+    emitir("=" * 40 + "\n")
+    emitir("      RELATÓRIO GERAL DE VENDAS\n")
+    emitir("=" * 40 + "\n")
 
-    print(f"\nResumo Geral:")
-    print(f"  - Total Geral de Vendas: {formatar_moeda(relatorio['total_vendas'])}")
-    print(f"  - Total de Transações:   {relatorio['total_transacoes']}")
+    emitir(f"\nResumo Geral:\n")
+    emitir(f"  - Total Geral de Vendas: {formatar_moeda(relatorio['total_vendas'])}\n")
+    emitir(f"  - Total de Transações:   {relatorio['total_transacoes']}\n")
     mes, valor = relatorio['melhor_mes']
     if mes:
-        print(f"  - Melhor Mês:            {mes} ({formatar_moeda(valor)})")
+        emitir(f"  - Melhor Mês:            {mes} ({formatar_moeda(valor)})\n")
 
-    print("\n" + "-" * 40)
-    print("Top 5 Vendedores (por Valor)")
-    print("-" * 40)
+    emitir("\n" + "-" * 40 + "\n")
+    emitir("Top 5 Vendedores (por Valor)\n")
+    emitir("-" * 40 + "\n")
     for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
-        print(f"  {i}. {vendedor:<20} - {formatar_moeda(total)}")
+        emitir(f"  {i}. {vendedor:<20} - {formatar_moeda(total)}\n")
 
-    print("\n" + "-" * 40)
-    print("Top 5 Produtos (por Quantidade)")
-    print("-" * 40)
+    emitir("\n" + "-" * 40 + "\n")
+    emitir("Top 5 Produtos (por Quantidade)\n")
+    emitir("-" * 40 + "\n")
     for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
-        print(f"  {i}. {produto:<20} - {qtd} unidades")
+        emitir(f"  {i}. {produto:<20} - {qtd} unidades\n")
 
-    print("\n" + "-" * 40)
-    print("Vendas por Mês")
-    print("-" * 40)
+    emitir("\n" + "-" * 40 + "\n")
+    emitir("Vendas por Mês\n")
+    emitir("-" * 40 + "\n")
     for mes, total in relatorio['vendas_por_mes'].items():
-        print(f"  - {mes}: {formatar_moeda(total)}")
+        emitir(f"  - {mes}: {formatar_moeda(total)}\n")
+
+    emitir("\n" + "=" * 40 + "\n")
+
+def exibir_relatorio_vendas():
+    """
+    Exibe relatório geral formatado no console.
+    """
+    relatorio = _relatorio_geral()
+
+    if not relatorio:
+        print("\n*** Nenhuma venda registrada para gerar relatório. ***")
+        return
 
-    print("\n" + "=" * 40)
+    partes = ["\n"]
+    _renderizar_texto(relatorio, partes.append)
+    print(''.join(partes), end='')
 
 def salvar_relatorio_geral():
     """
     Salva o relatório geral em um arquivo de texto.
     """
-    relatorio = gerar_relatorio_geral()
+    relatorio = _relatorio_geral()
     if not relatorio:
         print("\n*** Nenhuma venda registrada para salvar relatório. ***")
         return
 
+    filepath = os.path.join(PASTA_RELATORIOS, 'relatorio_geral.txt')
 
-    if not os.path.exists('relatorios'):
-        os.makedirs('relatorios')
-
-    filepath = 'relatorios/relatorio_geral.txt'
+    partes = []
+    _renderizar_texto(relatorio, partes.append)
 
     try:
+        _preparar_pasta_relatorios()
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("=" * 40 + "\n")
-            f.write("      RELATÓRIO GERAL DE VENDAS\n")
-            f.write("=" * 40 + "\n")
-
-            f.write(f"\nResumo Geral:\n")
-            f.write(f"  - Total Geral de Vendas: {formatar_moeda(relatorio['total_vendas'])}\n")
-            f.write(f"  - Total de Transações:   {relatorio['total_transacoes']}\n")
-            mes, valor = relatorio['melhor_mes']
-            if mes:
-                f.write(f"  - Melhor Mês:            {mes} ({formatar_moeda(valor)})\n")
-
-            f.write("\n" + "-" * 40 + "\n")
-            f.write("Top 5 Vendedores (por Valor)\n")
-            f.write("-" * 40 + "\n")
-            for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
-                f.write(f"  {i}. {vendedor:<20} - {formatar_moeda(total)}\n")
-
-            f.write("\n" + "-" * 40 + "\n")
-            f.write("Top 5 Produtos (por Quantidade)\n")
-            f.write("-" * 40 + "\n")
-            for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
-                f.write(f"  {i}. {produto:<20} - {qtd} unidades\n")
-
-            f.write("\n" + "-" * 40 + "\n")
-            f.write("Vendas por Mês\n")
-            f.write("-" * 40 + "\n")
-            for mes, total in relatorio['vendas_por_mes'].items():
-                f.write(f"  - {mes}: {formatar_moeda(total)}\n")
-
-            f.write("\n" + "=" * 40 + "\n")
-        
+            f.write(''.join(partes))
+
         print(f"\nRelatório salvo com sucesso em: {os.path.abspath(filepath)}")
     
     except IOError as e:
@@ -360,44 +541,54 @@ def salvar_relatorio_geral():
 # NOVA FUNÇÃO - SALVAR EM MARKDOWN
 # ============================================
 
+def _renderizar_markdown(relatorio, emitir):
+    """
+    Monta o relatório geral em Markdown, linha a linha.
+
+    Args:
+        relatorio (dict): Relatório gerado por gerar_relatorio_geral
+        emitir (callable): Recebe cada trecho de texto (ex.: list.append)
+    """
+    emitir("# Relatório Geral de Vendas\n\n")
+
+    emitir("## Resumo Geral\n\n")
+    emitir(f"* **Total Geral de Vendas:** {formatar_moeda(relatorio['total_vendas'])}\n")
+    emitir(f"* **Total de Transações:** {relatorio['total_transacoes']}\n")
+    mes, valor = relatorio['melhor_mes']
+    if mes:
+        emitir(f"* **Melhor Mês:** {mes} ({formatar_moeda(valor)})\n\n")
+
+    emitir("## Top 5 Vendedores (por Valor)\n\n")
+    for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
+        emitir(f"{i}.  **{vendedor}** - {formatar_moeda(total)}\n")
+
+    emitir("\n## Top 5 Produtos (por Quantidade)\n\n")
+    for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
+        emitir(f"{i}.  **{produto}** - {qtd} unidades\n")
+
+    emitir("\n## Vendas por Mês\n\n")
+    for mes, total in relatorio['vendas_por_mes'].items():
+        emitir(f"* **{mes}:** {formatar_moeda(total)}\n")
+
 def salvar_relatorio_markdown():
     """
     Salva o relatório geral em um arquivo Markdown (.md).
     """
-    relatorio = gerar_relatorio_geral()
+    relatorio = _relatorio_geral()
     if not relatorio:
         print("\n*** Nenhuma venda registrada para salvar relatório. ***")
         return
 
- 
-    if not os.path.exists('relatorios'):
-        os.makedirs('relatorios')
+    filepath = os.path.join(PASTA_RELATORIOS, 'relatorio_geral.md')
 
-    filepath = 'relatorios/relatorio_geral.md'
+    partes = []
+    _renderizar_markdown(relatorio, partes.append)
 
     try:
+        _preparar_pasta_relatorios()
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("# Relatório Geral de Vendas\n\n")
-
-            f.write("## Resumo Geral\n\n")
-            f.write(f"* **Total Geral de Vendas:** {formatar_moeda(relatorio['total_vendas'])}\n")
-            f.write(f"* **Total de Transações:** {relatorio['total_transacoes']}\n")
-            mes, valor = relatorio['melhor_mes']
-            if mes:
-                f.write(f"* **Melhor Mês:** {mes} ({formatar_moeda(valor)})\n\n")
-
-            f.write("## Top 5 Vendedores (por Valor)\n\n")
-            for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
-                f.write(f"{i}.  **{vendedor}** - {formatar_moeda(total)}\n")
-
-            f.write("\n## Top 5 Produtos (por Quantidade)\n\n")
-            for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
-                f.write(f"{i}.  **{produto}** - {qtd} unidades\n")
-
-            f.write("\n## Vendas por Mês\n\n")
-            for mes, total in relatorio['vendas_por_mes'].items():
-                f.write(f"* **{mes}:** {formatar_moeda(total)}\n")
-        
+            f.write(''.join(partes))
+
         print(f"\nRelatório Markdown salvo com sucesso em: {os.path.abspath(filepath)}")
     
     except IOError as e:
@@ -408,6 +599,9 @@ def salvar_relatorio_markdown():
 # FUNÇÕES AUXILIARES
 # ============================================
 
+# Troca os separadores do padrão americano (1,234.56) pelo brasileiro (1.234,56)
+_TABELA_BR = str.maketrans(',.', '.,')
+
 def formatar_moeda(valor):
     """
     Formata valor como moeda brasileira.
@@ -419,25 +613,31 @@ def formatar_moeda(valor):
         str: Valor formatado (R$ X.XXX,XX)
     """
 
-    valor_formatado = f"{valor:,.2f}"
- 
-    valor_formatado = valor_formatado.replace(",", "v").replace(".", ",").replace("v", ".")
-    return f"R$ {valor_formatado}"
+    return f"R$ {f'{valor:,.2f}'.translate(_TABELA_BR)}"
 
-def extrair_mes(data):
+def _preparar_pasta_relatorios():
     """
-    Extrai o mês de uma data no formato YYYY-MM-DD.
+    Garante que a pasta de relatórios existe, uma única vez por sessão.
+    """
+    global _pasta_relatorios_pronta
+
+    if not _pasta_relatorios_pronta:
+        os.makedirs(PASTA_RELATORIOS, exist_ok=True)
+        _pasta_relatorios_pronta = True
+
+def formatar_mes(codigo):
+    """
+    Converte um código de mês (ano * 12 + mês - 1) para texto.
 
     Args:
-        data (str): Data no formato YYYY-MM-DD
+        codigo (int): Código do mês
 
     Returns:
         str: Mês no formato YYYY-MM
     """
-   
-    if isinstance(data, str) and len(data) >= 7:
-        return data[0:7]
-    return "Data Inválida"
+    ano, mes = divmod(codigo, 12)
+    return f"{ano:04d}-{mes + 1:02d}"
+
 
 # ============================================
 # DADOS DE EXEMPLO (para facilitar testes)
@@ -3,11 +3,30 @@
 # Refatorado com Classe, Datetime e Type Hints
 # ============================================
 
+import copy
+import heapq
+import math
 import os
+import re
+import sys
 from collections import defaultdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Tuple, Union
 
+import numpy as np
+
+# Data YYYY-MM-DD; mês e dia sem zero à esquerda (2024-2-3) também passam,
+# como no antigo strptime('%Y-%m-%d')
+_DATA_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})', re.ASCII)
+
+# Limites das colunas int64 de quantidade e de total da venda em centavos
+QUANTIDADE_MAXIMA = int(np.iinfo(np.int64).max)
+CENTAVOS_MAXIMOS = int(np.iinfo(np.int64).max)
+
 # ============================================
 # FUNÇÕES AUXILIARES (Fora da Classe)
 # ============================================
@@ -16,12 +35,21 @@ def formatar_moeda(valor: float) -> str:
     """
     Formata valor como moeda brasileira.
 
+    Números passam pelo cache (relatórios repetem os mesmos totais);
+    qualquer outro valor é formatado direto, sem exigir que seja hashable.
+
     Args:
         valor (float): Valor a formatar
 
     Returns:
-        str: Valor formatado (R$ X.XXX,XX)
+        str: Valor formatado (R$ X.XXX,XX), ou R$ 0,00 se não for formatável
     """
+    if isinstance(valor, (int, float)):
+        return _formatar_moeda_em_cache(valor)
+    return _formatar_moeda(valor)
+
+def _formatar_moeda(valor: Any) -> str:
+    """Formatação de formatar_moeda, sem cache."""
     try:
         valor_formatado = f"{valor:,.2f}"
 
@@ -30,17 +58,34 @@ def formatar_moeda(valor: float) -> str:
     except Exception:
         return "R$ 0,00"
 
-def extrair_mes(data_obj: datetime) -> str:
-    """
-    Extrai o mês de um objeto datetime.
+_formatar_moeda_em_cache = lru_cache(maxsize=4096)(_formatar_moeda)
 
-    Args:
-        data_obj (datetime): O objeto de data.
+# ============================================
+# REGISTRO DE VENDA
+# ============================================
 
-    Returns:
-        str: Mês no formato YYYY-MM
+@dataclass
+class Venda:
+    """
+    Uma venda materializada a partir das colunas do SistemaVendas.
+
+    Com __slots__ cada registro ocupa bem menos memória que um dicionário
+    e os campos são lidos como atributos (venda.valor_total). Os slots são
+    declarados à mão porque dataclass(slots=True) exige Python 3.10.
     """
-    return data_obj.strftime('%Y-%m')
+    __slots__ = (
+        'id', 'produto', 'vendedor', 'quantidade',
+        'valor_unitario', 'valor_total', 'data_str', 'data_obj'
+    )
+
+    id: int
+    produto: str
+    vendedor: str
+    quantidade: int
+    valor_unitario: float
+    valor_total: float
+    data_str: str
+    data_obj: date
 
 # ============================================
 # CLASSE PRINCIPAL DO SISTEMA
@@ -51,13 +96,92 @@ class SistemaVendas:
     Encapsula toda a lógica e dados do sistema de vendas.
     """
     
-    def __init__(self):
+    TOP_K = 5  # tamanho dos rankings mantidos incrementalmente
+
+    COLUNAS_NUMPY = (
+        '_produto_codigo', '_vendedor_codigo', '_quantidade',
+        '_valor_unit', '_valor_total_centavos', '_data'
+    )
+
+    def __init__(self, capacidade: int = 64):
         """
-        Inicializa o sistema com listas vazias e contadores.
+        Inicializa o sistema com colunas vazias e contadores.
+
+        As vendas ficam em colunas numpy.ndarray paralelas (Struct-of-Arrays).
+        Produtos e vendedores são guardados como códigos int32 (ordem de
+        primeira ocorrência), com o nome resolvido em _nomes_produtos e
+        _nomes_vendedores. A capacidade dobra quando o buffer enche.
         """
-        self.vendas: List[Dict[str, Any]] = []
+        self.n: int = 0
+        self._produto_codigo: np.ndarray = np.empty(capacidade, dtype=np.int32)
+        self._vendedor_codigo: np.ndarray = np.empty(capacidade, dtype=np.int32)
+        self._nomes_produtos: List[str] = []
+        self._nomes_vendedores: List[str] = []
+        self._codigos_produtos: Dict[str, int] = {}
+        self._codigos_vendedores: Dict[str, int] = {}
+        self._quantidade: np.ndarray = np.empty(capacidade, dtype=np.int64)
+        self._valor_unit: np.ndarray = np.empty(capacidade, dtype=np.float64)
+        self._valor_total_centavos: np.ndarray = np.empty(capacidade, dtype=np.int64)
+        self._data: np.ndarray = np.empty(capacidade, dtype='datetime64[D]')
         self.contador_id: int = 1
 
+        # Agregados mantidos incrementalmente por registrar_venda
+        self._total_geral_centavos: int = 0
+        self._por_vendedor: List[List[int]] = []  # por código: [total_centavos, qtd_vendas]
+        self._por_produto: List[List[int]] = []   # por código: [total_centavos, qtd_unidades]
+        self._por_mes: Dict[int, int] = {}  # meses desde 1970-01 (datetime64[M]) -> centavos
+
+        # Top-K mantido a cada venda: heaps mínimos de (valor, -código)
+        self._top_vendedores: List[Tuple[int, int]] = []
+        self._top_produtos: List[Tuple[int, int]] = []
+        self._melhor_mes: Tuple[Optional[int], int] = (None, 0)
+
+        # Índice vendedor em minúsculas -> posições das suas vendas
+        self._vendedor_lower: Dict[str, List[int]] = defaultdict(list)
+
+        # Relatório geral memoizado; invalidado a cada nova venda
+        self._relatorio_cache: Optional[Dict[str, Any]] = None
+        self._cache_version: int = 0
+        self._texto_cache: Tuple[int, str] = (-1, '')
+        self._md_cache: Tuple[int, str] = (-1, '')
+
+    @property
+    def vendas(self) -> List[Venda]:
+        """Reconstrói a lista de vendas (sob demanda)."""
+        return [self._linha(i) for i in range(self.n)]
+
+    def _linha(self, i: int) -> Venda:
+        """Reconstrói a venda da posição i no formato de registrar_venda."""
+        data_obj = self._data[i].item()
+        return Venda(
+            id=i + 1,
+            produto=self._nomes_produtos[self._produto_codigo[i]],
+            vendedor=self._nomes_vendedores[self._vendedor_codigo[i]],
+            quantidade=int(self._quantidade[i]),
+            valor_unitario=float(self._valor_unit[i]),
+            valor_total=int(self._valor_total_centavos[i]) / 100,
+            data_str=data_obj.isoformat(),
+            data_obj=data_obj
+        )
+
+    def _crescer(self) -> None:
+        """Dobra a capacidade das colunas numpy, copiando as linhas ocupadas."""
+        capacidade = 2 * len(self._quantidade)
+        for nome in self.COLUNAS_NUMPY:
+            antiga = getattr(self, nome)
+            nova = np.empty(capacidade, dtype=antiga.dtype)
+            nova[:self.n] = antiga[:self.n]
+            setattr(self, nome, nova)
+
+    @staticmethod
+    def _codificar(codigos: Dict[str, int], nomes: List[str], nome: str) -> int:
+        """Retorna o código de um nome, atribuindo o próximo livre se for novo."""
+        codigo = codigos.get(nome)
+        if codigo is None:
+            codigo = codigos[nome] = len(nomes)
+            nomes.append(nome)
+        return codigo
+
     # ============================================
     # FUNÇÕES DE CADASTRO
     # ============================================
@@ -69,7 +193,7 @@ class SistemaVendas:
         quantidade: int, 
         valor_unitario: float, 
         data: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Venda]:
         """
         Registra uma nova venda após validar os dados.
 
@@ -81,7 +205,7 @@ class SistemaVendas:
             data (str): Data da venda (YYYY-MM-DD)
 
         Returns:
-            Optional[Dict[str, Any]]: Venda registrada ou None se houver erro.
+            Optional[Venda]: Venda registrada ou None se houver erro.
         """
        
         if not all([produto, vendedor, data]):
@@ -90,86 +214,161 @@ class SistemaVendas:
         if not isinstance(quantidade, int) or quantidade <= 0:
             print("Erro: Quantidade deve ser um número inteiro positivo.")
             return None
+        if quantidade > QUANTIDADE_MAXIMA:
+            print(f"Erro: Quantidade não pode ser maior que {QUANTIDADE_MAXIMA}.")
+            return None
         if not isinstance(valor_unitario, (int, float)) or valor_unitario <= 0:
             print("Erro: Valor unitário deve ser um número positivo.")
             return None
+        if isinstance(valor_unitario, float) and not math.isfinite(valor_unitario):
+            print("Erro: Valor unitário deve ser um número finito.")
+            return None
+
+        # Total em centavos a partir do valor digitado (Decimal), com
+        # arredondamento meio para cima, como na conta feita à mão
+        centavos = Decimal(str(valor_unitario)) * quantidade * 100
+        if centavos > CENTAVOS_MAXIMOS:
+            print("Erro: Valor total da venda excede o limite suportado.")
+            return None
+        valor_total_centavos = int(centavos.quantize(Decimal(1), rounding=ROUND_HALF_UP))
 
     
+        m = _DATA_RE.fullmatch(data)
         try:
-            data_obj = datetime.strptime(data, '%Y-%m-%d')
-            data_str = data_obj.strftime('%Y-%m-%d')
+            if m is None:
+                raise ValueError(data)
+            ano, mes, dia = map(int, m.groups())
+            data_obj = date(ano, mes, dia)
         except ValueError:
             print("Erro: Data inválida ou fora do formato YYYY-MM-DD.")
             return None
-
-        valor_total = round(quantidade * valor_unitario, 2)
-
-        venda = {
-            'id': self.contador_id,
-            'produto': produto.strip(),
-            'vendedor': vendedor.strip(),
-            'quantidade': quantidade,
-            'valor_unitario': valor_unitario,
-            'valor_total': valor_total,
-            'data_str': data_str,
-            'data_obj': data_obj  
-        }
-
-        self.vendas.append(venda)
+        data_str = data if len(data) == 10 else data_obj.isoformat()
+
+        venda = Venda(
+            id=self.contador_id,
+            produto=sys.intern(produto.strip()),
+            vendedor=sys.intern(vendedor.strip()),
+            quantidade=quantidade,
+            valor_unitario=valor_unitario,
+            valor_total=valor_total_centavos / 100,
+            data_str=data_str,
+            data_obj=data_obj
+        )
+
+        if self.n == len(self._quantidade):
+            self._crescer()
+
+        # Colunas numéricas primeiro: se alguma escrita falhar, nenhum código
+        # de produto/vendedor foi distribuído e o índice continua intacto
+        i = self.n
+        self._quantidade[i] = quantidade
+        self._valor_unit[i] = valor_unitario
+        self._valor_total_centavos[i] = valor_total_centavos
+        self._data[i] = np.datetime64(data_str, 'D')
+
+        codigo_produto = self._codificar(self._codigos_produtos, self._nomes_produtos, venda.produto)
+        codigo_vendedor = self._codificar(
+            self._codigos_vendedores, self._nomes_vendedores, venda.vendedor
+        )
+        self._produto_codigo[i] = codigo_produto
+        self._vendedor_codigo[i] = codigo_vendedor
+        self._vendedor_lower[venda.vendedor.lower()].append(i)
+        self.n += 1
         self.contador_id += 1
+        self._atualizar_agregados(venda, valor_total_centavos, codigo_vendedor, codigo_produto)
+        self._relatorio_cache = None
+        self._cache_version += 1
 
-        print(f"Venda ID {venda['id']} registrada com sucesso!")
+        print(f"Venda ID {venda.id} registrada com sucesso!")
         return venda
 
+    def _atualizar_agregados(
+        self, venda: Venda, valor_total: int, codigo_vendedor: int, codigo_produto: int
+    ) -> None:
+        """
+        Soma a contribuição de uma venda aos agregados incrementais.
+
+        Como quantidade e valor são sempre positivos, os totais só crescem:
+        a única entrada que pode subir no top-K é a que acabou de mudar.
+        Todos os valores são acumulados em centavos, indexados pelo código
+        do vendedor/produto (um código novo é sempre o próximo da lista).
+        """
+        self._total_geral_centavos += valor_total
+
+        if codigo_vendedor == len(self._por_vendedor):
+            self._por_vendedor.append([0, 0])
+        acumulado = self._por_vendedor[codigo_vendedor]
+        acumulado[0] += valor_total
+        acumulado[1] += 1
+        self._atualizar_top(self._top_vendedores, codigo_vendedor, acumulado[0])
+
+        if codigo_produto == len(self._por_produto):
+            self._por_produto.append([0, 0])
+        acumulado = self._por_produto[codigo_produto]
+        acumulado[0] += valor_total
+        acumulado[1] += venda.quantidade
+        self._atualizar_top(self._top_produtos, codigo_produto, acumulado[1])
+
+        data_obj = venda.data_obj
+        mes = (data_obj.year - 1970) * 12 + data_obj.month - 1
+        total_mes = self._por_mes[mes] = self._por_mes.get(mes, 0) + valor_total
+
+        melhor, total_melhor = self._melhor_mes
+        if melhor is None or total_mes > total_melhor or (total_mes == total_melhor and mes <= melhor):
+            self._melhor_mes = (mes, total_mes)
+
+    @classmethod
+    def _atualizar_top(cls, heap: List[Tuple[int, int]], codigo: int, valor: int) -> None:
+        """
+        Atualiza o heap mínimo com os TOP_K maiores valores.
+
+        Empates favorecem quem apareceu primeiro (menor código), como no
+        ranking por heapq.nlargest sobre os agregados.
+        """
+        item = (valor, -codigo)
+        for j, (_, atual) in enumerate(heap):
+            if atual == -codigo:
+                heap[j] = item
+                heapq.heapify(heap)
+                return
+
+        if len(heap) < cls.TOP_K:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
     # ============================================
     # FUNÇÕES DE CÁLCULOS
     # ============================================
 
     def calcular_total_vendas(self) -> float:
         """Calcula o total geral de vendas."""
-        if not self.vendas:
-            return 0.0
-        return sum([v['valor_total'] for v in self.vendas])
+        return self._total_geral_centavos / 100
 
     def calcular_vendas_por_vendedor(self) -> Dict[str, Dict[str, float]]:
         """Calcula estatísticas de vendas por vendedor."""
-        stats = defaultdict(lambda: {'total_vendas': 0.0, 'quantidade_vendas': 0})
-
-        for venda in self.vendas:
-            vendedor = venda['vendedor']
-            stats[vendedor]['total_vendas'] += venda['valor_total']
-            stats[vendedor]['quantidade_vendas'] += 1
-
-   
-        for vendedor in stats:
-            total = stats[vendedor]['total_vendas']
-            qtd = stats[vendedor]['quantidade_vendas']
-            stats[vendedor]['valor_medio'] = total / qtd if qtd > 0 else 0.0
-
-        return dict(stats)
+        return {
+            vendedor: {'total_vendas': total / 100, 'quantidade_vendas': qtd, 'valor_medio': total / 100 / qtd}
+            for vendedor, (total, qtd) in zip(self._nomes_vendedores, self._por_vendedor)
+        }
 
     def calcular_vendas_por_produto(self) -> Dict[str, Dict[str, Union[int, float]]]:
-        """Calcula estatísticas de vendas por produto."""
-        stats = defaultdict(lambda: {'total_vendido': 0.0, 'quantidade_vendida': 0})
-
-        for venda in self.vendas:
-            produto = venda['produto']
-            stats[produto]['total_vendido'] += venda['valor_total']
-            stats[produto]['quantidade_vendida'] += venda['quantidade']
-
-        for produto in stats:
-            stats[produto]['receita'] = stats[produto]['total_vendido']
+        """
+        Calcula estatísticas de vendas por produto.
 
-        return dict(stats)
+        A receita de um produto é o próprio 'total_vendido'; não há chave
+        'receita' separada.
+        """
+        return {
+            produto: {'total_vendido': total / 100, 'quantidade_vendida': qtd}
+            for produto, (total, qtd) in zip(self._nomes_produtos, self._por_produto)
+        }
 
     def calcular_vendas_por_mes(self) -> Dict[str, float]:
         """Calcula vendas agrupadas por mês."""
-        stats = defaultdict(float)
-        for venda in self.vendas:
-            mes = extrair_mes(venda['data_obj'])
-            stats[mes] += venda['valor_total']
-
-        return dict(sorted(stats.items()))
+        meses = sorted(self._por_mes)
+        rotulos = np.array(meses, dtype='datetime64[M]').astype(str).tolist()
+        return {rotulo: self._por_mes[mes] / 100 for rotulo, mes in zip(rotulos, meses)}
 
     # ============================================
     # FUNÇÕES DE RANKINGS
@@ -177,38 +376,48 @@ class SistemaVendas:
 
     def ranking_vendedores(self, limite: int = 5) -> List[Tuple[str, float]]:
         """Gera ranking dos melhores vendedores por valor total."""
-        stats_vendedor = self.calcular_vendas_por_vendedor()
-        stats_lista = stats_vendedor.items()
-        
-        ranking = sorted(stats_lista, key=lambda item: item[1]['total_vendas'], reverse=True)
+        if limite <= self.TOP_K:
+            top = sorted(self._top_vendedores, reverse=True)[:limite]
+            return [(self._nomes_vendedores[-codigo], total / 100) for total, codigo in top]
+
+        totais = (
+            (vendedor, total / 100) for vendedor, (total, _) in zip(self._nomes_vendedores, self._por_vendedor)
+        )
         
-        return [(vendedor, dados['total_vendas']) for vendedor, dados in ranking[:limite]]
+        return heapq.nlargest(limite, totais, key=itemgetter(1))
 
     def ranking_produtos(self, limite: int = 5) -> List[Tuple[str, int]]:
         """Gera ranking dos produtos mais vendidos por quantidade."""
-        stats_produto = self.calcular_vendas_por_produto()
-        stats_lista = stats_produto.items()
+        if limite <= self.TOP_K:
+            top = sorted(self._top_produtos, reverse=True)[:limite]
+            return [(self._nomes_produtos[-codigo], qtd) for qtd, codigo in top]
 
-        ranking = sorted(stats_lista, key=lambda item: item[1]['quantidade_vendida'], reverse=True)
+        quantidades = ((produto, qtd) for produto, (_, qtd) in zip(self._nomes_produtos, self._por_produto))
 
-        return [(produto, int(dados['quantidade_vendida'])) for produto, dados in ranking[:limite]]
+        return heapq.nlargest(limite, quantidades, key=itemgetter(1))
 
     def melhor_mes(self) -> Tuple[Optional[str], float]:
         """Identifica o mês com maior volume de vendas."""
-        vendas_mes = self.calcular_vendas_por_mes()
-        if not vendas_mes:
+        mes, total = self._melhor_mes
+        if mes is None:
             return (None, 0.0)
         
-        return max(vendas_mes.items(), key=lambda item: item[1])
+        return (str(np.datetime64(mes, 'M')), total / 100)
 
     # ============================================
     # FUNÇÕES DE GERAÇÃO DE RELATÓRIOS (DADOS)
     # ============================================
 
     def gerar_relatorio_geral(self) -> Optional[Dict[str, Any]]:
-        """Coleta todas as estatísticas para o relatório."""
-        if not self.vendas:
+        """Coleta todas as estatísticas para o relatório (cópia, livre para alterar)."""
+        return copy.deepcopy(self._relatorio_geral())
+
+    def _relatorio_geral(self) -> Optional[Dict[str, Any]]:
+        """Relatório geral em cache até a próxima venda; não deve ser alterado."""
+        if not self.n:
             return None
+        if self._relatorio_cache is not None:
+            return self._relatorio_cache
 
         relatorio = {
             'total_vendas': self.calcular_total_vendas(),
@@ -218,159 +427,193 @@ class SistemaVendas:
             'ranking_vendedores': self.ranking_vendedores(5),
             'ranking_produtos': self.ranking_produtos(5),
             'melhor_mes': self.melhor_mes(),
-            'total_transacoes': len(self.vendas)
+            'total_transacoes': self.n
         }
+        self._relatorio_cache = relatorio
         return relatorio
 
     def gerar_relatorio_vendedor(self, nome_vendedor: str) -> Optional[Dict[str, Any]]:
         """Gera relatório específico de um vendedor."""
         
 
-        vendas_do_vendedor = [
-            v for v in self.vendas if nome_vendedor.lower() in v['vendedor'].lower()
+        consulta = nome_vendedor.lower()
+        candidatos = [
+            linhas for vendedor, linhas in self._vendedor_lower.items() if consulta in vendedor
         ]
 
-        if not vendas_do_vendedor:
+        if not candidatos:
             return None
 
-        total_vendas = sum(v['valor_total'] for v in vendas_do_vendedor)
-        quantidade_vendas = len(vendas_do_vendedor)
+        indices = candidatos[0] if len(candidatos) == 1 else list(heapq.merge(*candidatos))
+
+        # Soma em int do Python: a soma int64 do numpy poderia estourar
+        total_vendas = sum(self._valor_total_centavos[indices].tolist()) / 100
+        quantidade_vendas = len(indices)
         valor_medio = total_vendas / quantidade_vendas if quantidade_vendas > 0 else 0.0
 
-        produtos_vendidos = defaultdict(int)
-        for v in vendas_do_vendedor:
-            produtos_vendidos[v['produto']] += v['quantidade']
+        # Quantidades somadas como int do Python (exatas mesmo perto do limite
+        # int64), na ordem em que os produtos aparecem nas vendas do vendedor
+        por_codigo: Dict[int, int] = {}
+        for codigo, qtd in zip(self._produto_codigo[indices].tolist(), self._quantidade[indices].tolist()):
+            por_codigo[codigo] = por_codigo.get(codigo, 0) + qtd
+        produtos_vendidos = {
+            self._nomes_produtos[codigo]: qtd for codigo, qtd in por_codigo.items()
+        }
 
 
-        nome_oficial = vendas_do_vendedor[0]['vendedor']
+        nome_oficial = self._nomes_vendedores[self._vendedor_codigo[indices[0]]]
 
         return {
             'nome': nome_oficial,
             'total_vendas': total_vendas,
             'quantidade_transacoes': quantidade_vendas,
             'valor_medio_transacao': valor_medio,
-            'produtos_vendidos': dict(produtos_vendidos),
-            'lista_vendas': vendas_do_vendedor
+            'produtos_vendidos': produtos_vendidos,
+            'lista_vendas': [self._linha(i) for i in indices]
         }
 
     # ============================================
     # FUNÇÕES DE FORMATAÇÃO E EXPORTAÇÃO (SAÍDA)
     # ============================================
 
-    def _formatar_relatorio_texto(self, relatorio: Dict[str, Any]) -> List[str]:
+    def _formatar_relatorio_texto(self) -> str:
         """
-        Função interna para formatar o relatório como texto (para console ou .txt).
+        Função interna para formatar o relatório geral como texto (para console ou .txt).
+
+        O texto é montado a partir de _relatorio_geral() e fica em cache
+        até a próxima venda registrada.
         """
-        linhas: List[str] = []
-        
-        linhas.append("=" * 40)
-        linhas.append("      RELATÓRIO GERAL DE VENDAS")
-        linhas.append("=" * 40)
+        versao, texto_em_cache = self._texto_cache
+        if versao == self._cache_version:
+            return texto_em_cache
+
+        relatorio = self._relatorio_geral()
 
-        linhas.append("\nResumo Geral:")
-        linhas.append(f"  - Total Geral de Vendas: {formatar_moeda(relatorio['total_vendas'])}")
-        linhas.append(f"  - Total de Transações:   {relatorio['total_transacoes']}")
+        separador = "-" * 40
         mes, valor = relatorio['melhor_mes']
+
+        linhas: List[str] = [
+            "=" * 40,
+            "      RELATÓRIO GERAL DE VENDAS",
+            "=" * 40,
+            "\nResumo Geral:",
+            f"  - Total Geral de Vendas: {formatar_moeda(relatorio['total_vendas'])}",
+            f"  - Total de Transações:   {relatorio['total_transacoes']}",
+        ]
         if mes:
             linhas.append(f"  - Melhor Mês:            {mes} ({formatar_moeda(valor)})")
 
-        linhas.append("\n" + "-" * 40)
-        linhas.append("Top 5 Vendedores (por Valor)")
-        linhas.append("-" * 40)
-        for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
-            linhas.append(f"  {i}. {vendedor:<20} - {formatar_moeda(total)}")
+        linhas += ["\n" + separador, "Top 5 Vendedores (por Valor)", separador]
+        linhas.extend([
+            f"  {i}. {vendedor:<20} - {formatar_moeda(total)}"
+            for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1)
+        ])
 
-        linhas.append("\n" + "-" * 40)
-        linhas.append("Top 5 Produtos (por Quantidade)")
-        linhas.append("-" * 40)
-        for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
-            linhas.append(f"  {i}. {produto:<20} - {qtd} unidades")
+        linhas += ["\n" + separador, "Top 5 Produtos (por Quantidade)", separador]
+        linhas.extend([
+            f"  {i}. {produto:<20} - {qtd} unidades"
+            for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1)
+        ])
 
-        linhas.append("\n" + "-" * 40)
-        linhas.append("Vendas por Mês")
-        linhas.append("-" * 40)
-        for mes, total in relatorio['vendas_por_mes'].items():
-            linhas.append(f"  - {mes}: {formatar_moeda(total)}")
+        linhas += ["\n" + separador, "Vendas por Mês", separador]
+        linhas.extend([
+            f"  - {mes}: {formatar_moeda(total)}"
+            for mes, total in relatorio['vendas_por_mes'].items()
+        ])
 
         linhas.append("\n" + "=" * 40)
         
-        return linhas
+        texto = "\n".join(linhas)
+        self._texto_cache = (self._cache_version, texto)
+        return texto
 
-    def _formatar_relatorio_markdown(self, relatorio: Dict[str, Any]) -> List[str]:
+    def _formatar_relatorio_markdown(self) -> str:
         """
-        Função interna para formatar o relatório como Markdown.
+        Função interna para formatar o relatório geral como Markdown.
+
+        O texto é montado a partir de _relatorio_geral() e fica em cache
+        até a próxima venda registrada.
         """
-        linhas: List[str] = []
-        
-        linhas.append("# Relatório Geral de Vendas\n")
-        
-        linhas.append("## Resumo Geral\n")
-        linhas.append(f"* **Total Geral de Vendas:** {formatar_moeda(relatorio['total_vendas'])}")
-        linhas.append(f"* **Total de Transações:** {relatorio['total_transacoes']}")
+        versao, texto_em_cache = self._md_cache
+        if versao == self._cache_version:
+            return texto_em_cache
+
+        relatorio = self._relatorio_geral()
+
         mes, valor = relatorio['melhor_mes']
+
+        linhas: List[str] = [
+            "# Relatório Geral de Vendas\n",
+            "## Resumo Geral\n",
+            f"* **Total Geral de Vendas:** {formatar_moeda(relatorio['total_vendas'])}",
+            f"* **Total de Transações:** {relatorio['total_transacoes']}",
+        ]
         if mes:
             linhas.append(f"* **Melhor Mês:** {mes} ({formatar_moeda(valor)})\n")
         
         linhas.append("## Top 5 Vendedores (por Valor)\n")
-        for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1):
-            linhas.append(f"{i}.  **{vendedor}** - {formatar_moeda(total)}")
+        linhas.extend([
+            f"{i}.  **{vendedor}** - {formatar_moeda(total)}"
+            for i, (vendedor, total) in enumerate(relatorio['ranking_vendedores'], 1)
+        ])
         
         linhas.append("\n## Top 5 Produtos (por Quantidade)\n")
-        for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1):
-            linhas.append(f"{i}.  **{produto}** - {qtd} unidades")
+        linhas.extend([
+            f"{i}.  **{produto}** - {qtd} unidades"
+            for i, (produto, qtd) in enumerate(relatorio['ranking_produtos'], 1)
+        ])
         
         linhas.append("\n## Vendas por Mês\n")
-        for mes, total in relatorio['vendas_por_mes'].items():
-            linhas.append(f"* **{mes}:** {formatar_moeda(total)}")
+        linhas.extend([
+            f"* **{mes}:** {formatar_moeda(total)}"
+            for mes, total in relatorio['vendas_por_mes'].items()
+        ])
             
-        return linhas
+        texto = "\n".join(linhas)
+        self._md_cache = (self._cache_version, texto)
+        return texto
 
     def exibir_relatorio_vendas(self) -> None:
         """Exibe relatório geral formatado no console."""
-        relatorio = self.gerar_relatorio_geral()
+        relatorio = self._relatorio_geral()
         if not relatorio:
             print("\n*** Nenhuma venda registrada para gerar relatório. ***")
             return
             
-        linhas_formatadas = self._formatar_relatorio_texto(relatorio)
-        print("\n".join(linhas_formatadas))
+        print(self._formatar_relatorio_texto())
 
     def salvar_relatorio_geral(self, pasta: str = 'relatorios', nome_arquivo: str = 'relatorio_geral.txt') -> None:
         """Salva o relatório geral em um arquivo de texto."""
-        relatorio = self.gerar_relatorio_geral()
+        relatorio = self._relatorio_geral()
         if not relatorio:
             print("\n*** Nenhuma venda registrada para salvar relatório. ***")
             return
 
-        if not os.path.exists(pasta):
-            os.makedirs(pasta)
-        
         filepath = os.path.join(pasta, nome_arquivo)
         
         try:
-            linhas_formatadas = self._formatar_relatorio_texto(relatorio)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("\n".join(linhas_formatadas))
+            os.makedirs(pasta, exist_ok=True)
+            payload = self._formatar_relatorio_texto().encode('utf-8')
+            with open(filepath, 'wb') as f:
+                f.write(payload)
             print(f"\nRelatório salvo com sucesso em: {os.path.abspath(filepath)}")
         except IOError as e:
             print(f"\nErro ao salvar relatório: {e}")
 
     def salvar_relatorio_markdown(self, pasta: str = 'relatorios', nome_arquivo: str = 'relatorio_geral.md') -> None:
         """Salva o relatório geral em um arquivo Markdown (.md)."""
-        relatorio = self.gerar_relatorio_geral()
+        relatorio = self._relatorio_geral()
         if not relatorio:
             print("\n*** Nenhuma venda registrada para salvar relatório. ***")
             return
 
-        if not os.path.exists(pasta):
-            os.makedirs(pasta)
-            
         filepath = os.path.join(pasta, nome_arquivo)
         
         try:
-            linhas_formatadas = self._formatar_relatorio_markdown(relatorio)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("\n".join(linhas_formatadas))
+            os.makedirs(pasta, exist_ok=True)
+            payload = self._formatar_relatorio_markdown().encode('utf-8')
+            with open(filepath, 'wb') as f:
+                f.write(payload)
             print(f"\nRelatório Markdown salvo com sucesso em: {os.path.abspath(filepath)}")
         except IOError as e:
             print(f"\nErro ao salvar relatório Markdown: {e}")